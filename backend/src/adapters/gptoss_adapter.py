@@ -70,9 +70,8 @@ class GptOssAdapter(ModelAdapter):
         return moe_block.experts  # Fused GptOssExperts module
 
     def compute_routing_weights(self, moe_block: nn.Module, hidden_states: torch.Tensor) -> torch.Tensor:
-        batch, seq, dim = hidden_states.shape
-        flat = hidden_states.reshape(-1, dim)
+        # Router forward only returns top-k scores, so full logits are recomputed here.
+        # F.linear handles [batch, seq, dim] directly - no flatten/reshape round-trip.
         router = moe_block.router
-        logits = F.linear(flat, router.weight, router.bias)
-        weights = F.softmax(logits, dim=-1)
-        return weights.reshape(batch, seq, -1)
+        logits = F.linear(hidden_states, router.weight, router.bias)
+        return F.softmax(logits, dim=-1)
@@ -69,10 +69,7 @@ class OLMoEAdapter(ModelAdapter):
         return moe_block.experts  # OlmoeExperts fused module
 
     def compute_routing_weights(self, moe_block: nn.Module, hidden_states: torch.Tensor) -> torch.Tensor:
-        batch, seq, dim = hidden_states.shape
-        flat = hidden_states.reshape(-1, dim)
         # Manual linear using gate's weight parameter (no bias).
-        # Cannot call gate(flat) directly — that triggers full top-k routing.
-        logits = F.linear(flat, moe_block.gate.weight)
-        weights = F.softmax(logits, dim=-1)
-        return weights.reshape(batch, seq, -1)
+        # Cannot call gate(hidden_states) directly — that triggers full top-k routing.
+        logits = F.linear(hidden_states, moe_block.gate.weight)
+        return F.softmax(logits, dim=-1)
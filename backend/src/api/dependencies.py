@@ -4,6 +4,7 @@ Simple dependency injection for shared services.
 """
 
 import logging
+import os
 import sys
 import threading
 import time
@@ -63,7 +64,9 @@ def _load_model_sync():
             tokenizer=tokenizer,
             layers_to_capture=adapter.layers_range(),
             data_lake_path=str(data_lake_path),
-            adapter=adapter
+            adapter=adapter,
+            # Optional memory-mapped activation spill directory (e.g. /dev/shm/concept_mri)
+            spill_dir=os.getenv("CONCEPT_MRI_SPILL_DIR") or None,
         )
 
         elapsed = time.time() - _loading_start_time
@@ -8,9 +8,9 @@ import logging
 import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import torch
 from api.routers import probes, experiments, generation, prompts
 from api.dependencies import initialize_capture_service, is_model_loaded, get_loading_status
+from utils.memory_utils import get_gpu_name
 
 logger = logging.getLogger(__name__)
 
@@ -46,12 +46,13 @@ async def root():
 
 @app.get("/health")
 async def health_check():
+    gpu_name = get_gpu_name()
     return {
         "status": "healthy",
         "model_loaded": is_model_loaded(),
         "loading": get_loading_status(),
-        "gpu_available": torch.cuda.is_available(),
-        "gpu_name": torch.cuda.get_device_name(0) if torch.cuda.is_available() else None,
+        "gpu_available": gpu_name is not None,
+        "gpu_name": gpu_name,
         "sessions_available": True,
     }
 
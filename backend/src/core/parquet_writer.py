@@ -4,6 +4,7 @@ Batch Parquet writer for consistent data storage across all schemas.
 Handles numpy array serialization and batch accumulation.
 """
 
+import logging
 from typing import List, Any, Dict
 from pathlib import Path
 import pyarrow as pa
@@ -11,7 +12,9 @@ import pyarrow.parquet as pq
 import numpy as np
 from dataclasses import asdict
 
-from utils.parquet_utils import serialize_array_for_parquet
+from utils.parquet_utils import serialize_array_for_parquet, pack_arrays_as_list_column
+
+logger = logging.getLogger(__name__)
 
 
 class BatchWriter:
@@ -42,7 +45,7 @@ class BatchWriter:
         # Convert dataclass to dict
         record_dict = asdict(record)
         
-        # Convert numpy arrays to lists for Parquet storage
+        # Flatten numpy arrays to float32 buffers for Parquet storage
         record_dict = self._serialize_numpy_arrays(record_dict)
         
         self.records.append(record_dict)
@@ -52,7 +55,7 @@ class BatchWriter:
             self.flush()
     
     def _serialize_numpy_arrays(self, record_dict: Dict) -> Dict:
-        """Convert numpy arrays to lists for Parquet storage."""
+        """Flatten numpy arrays to contiguous float32 buffers for Parquet storage."""
         serialized = {}
         
         for key, value in record_dict.items():
@@ -63,6 +66,17 @@ class BatchWriter:
         
         return serialized
     
+    def _build_table(self) -> pa.Table:
+        """Build an Arrow table, packing array columns directly from numpy buffers."""
+        columns = {}
+        for key in self.records[0]:
+            values = [record[key] for record in self.records]
+            if isinstance(values[0], np.ndarray):
+                columns[key] = pack_arrays_as_list_column(values)
+            else:
+                columns[key] = pa.array(values)
+        return pa.table(columns)
+    
     def flush(self) -> None:
         """Write accumulated records to Parquet file."""
         if not self.records:
@@ -70,12 +84,14 @@ class BatchWriter:
         
         try:
             # Convert to Arrow table
-            table = pa.Table.from_pylist(self.records)
+            table = self._build_table()
             
             # Handle appending for older PyArrow versions
             if self.file_path.exists():
-                # Read existing data and combine
+                # Read existing data and combine (older files store list<double>)
                 existing_table = pq.read_table(self.file_path)
+                if table.schema != existing_table.schema:
+                    table = table.cast(existing_table.schema)
                 combined_table = pa.concat_tables([existing_table, table])
                 pq.write_table(combined_table, self.file_path)
             else:
@@ -86,7 +102,7 @@ class BatchWriter:
             
         except Exception as e:
             # Log error but don't crash - just keep records for retry
-            print(f"Failed to write batch to {self.file_path}: {e}")
+            logger.error(f"Failed to write batch to {self.file_path}: {e}")
             raise
     
     def __enter__(self):
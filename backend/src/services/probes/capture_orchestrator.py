@@ -22,18 +22,21 @@ logger = logging.getLogger(__name__)
 class CaptureOrchestrator:
     """Manages model inference, hook lifecycle, and GPU memory."""
 
-    def __init__(self, model, tokenizer, adapter: Optional['ModelAdapter'], layers_to_capture: List[int]):
+    def __init__(self, model, tokenizer, adapter: Optional['ModelAdapter'], layers_to_capture: List[int],
+                 spill_dir: Optional[str] = None):
         self.model = model
         self.tokenizer = tokenizer
         self.adapter = adapter
         self.layers_to_capture = layers_to_capture
+        self.spill_dir = spill_dir  # Optional memory-mapped activation storage (e.g. a tmpfs path)
         self.routing_capture: Optional[EnhancedRoutingCapture] = None
 
     def initialize_hooks(self, session_id: str) -> None:
         """Initialize routing capture hooks (lazy — only first call creates them)."""
         if self.routing_capture is None:
             self.routing_capture = EnhancedRoutingCapture(
-                self.model, self.layers_to_capture, adapter=self.adapter
+                self.model, self.layers_to_capture, adapter=self.adapter,
+                spill_dir=self.spill_dir,
             )
             self.routing_capture.register_hooks()
             logger.info(f"Registered hooks for session {session_id}")
@@ -42,6 +45,7 @@ class CaptureOrchestrator:
         """Remove all hooks and free GPU memory."""
         if self.routing_capture is not None:
             self.routing_capture.remove_hooks()
+            self.routing_capture.clear_data()
             self.routing_capture = None
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
@@ -100,6 +104,7 @@ class CaptureOrchestrator:
 
     def get_captured_data(self) -> Tuple[Dict, Dict, Dict]:
         """Return the three captured data dicts from the last forward pass."""
+        self.routing_capture.synchronize()
         return (
             self.routing_capture.routing_data,
             self.routing_capture.embedding_data,
@@ -87,7 +87,7 @@ class IntegratedCaptureService:
 
     def __init__(self, model, tokenizer, layers_to_capture: Optional[List[int]] = None,
                  data_lake_path: str = "data/lake", batch_size: int = 1000,
-                 wordnet_miner=None, adapter=None):
+                 wordnet_miner=None, adapter=None, spill_dir: Optional[str] = None):
         self.adapter = adapter
 
         if layers_to_capture is None:
@@ -104,7 +104,8 @@ class IntegratedCaptureService:
             hidden_size=topology.hidden_size if topology else 0,
         )
         self.processor = ProbeProcessor(tokenizer, adapter, layers_to_capture)
-        self.orchestrator = CaptureOrchestrator(model, tokenizer, adapter, layers_to_capture)
+        self.orchestrator = CaptureOrchestrator(model, tokenizer, adapter, layers_to_capture,
+                                                spill_dir=spill_dir)
         self.session_writers: Dict[str, SessionBatchWriters] = {}
 
         logger.info(f"IntegratedCaptureService initialized for layers {layers_to_capture}")
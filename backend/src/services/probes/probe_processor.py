@@ -7,6 +7,7 @@ No model inference, no I/O, no GPU state.
 """
 
 import logging
+import numpy as np
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
@@ -140,31 +141,31 @@ class ProbeProcessor:
             layer_routing = routing_data[layer_key]
 
             for actual_pos, semantic_pos in positions_to_extract:
-                routing_weights = layer_routing["routing_weights"][0, actual_pos, :]
+                routing_weights = layer_routing.routing_weights[0, actual_pos, :]
                 routing_records.append(create_routing_record(
                     probe_id=probe_id, layer=layer,
                     token_position=semantic_pos,
                     routing_weights=routing_weights.numpy(),
                 ))
 
-            if layer_key in embedding_data:
-                emb_layer = embedding_data[layer_key]
+            emb_layer = embedding_data.get(layer_key)
+            if emb_layer is not None and emb_layer.embedding is not None:
                 for actual_pos, semantic_pos in positions_to_extract:
-                    emb_vec = emb_layer["embedding"][0, actual_pos, :]
+                    emb_vec = emb_layer.embedding[0, actual_pos, :]
                     embedding_records.append(create_embedding_record(
                         probe_id=probe_id, layer=layer,
                         token_position=semantic_pos,
-                        embedding=emb_vec.numpy(),
+                        embedding=np.asarray(emb_vec),
                     ))
 
             if layer_key in residual_stream_data:
                 res_layer = residual_stream_data[layer_key]
                 for actual_pos, semantic_pos in positions_to_extract:
-                    residual_state = res_layer["residual_stream"][0, actual_pos, :]
+                    residual_state = res_layer.residual_stream[0, actual_pos, :]
                     residual_stream_records.append(create_residual_stream_state(
                         probe_id=probe_id, layer=layer,
                         token_position=semantic_pos,
-                        residual_stream=residual_state.numpy(),
+                        residual_stream=np.asarray(residual_state),
                     ))
 
         return ProbeCapture(
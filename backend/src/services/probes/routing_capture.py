@@ -1,20 +1,51 @@
 #!/usr/bin/env python3
 """
-Enhanced MoE routing capture with full routing weights and individual expert hooks.
+Enhanced MoE routing capture with full routing weights and collective expert output.
 Simple approach: register all hooks upfront, no complex dynamic registration.
+One hook on the MoE block per layer (no per-expert hooks) plus one residual hook.
 """
 
+import os
 import torch
-from typing import Dict, List, Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union, TYPE_CHECKING
 import numpy as np
 import logging
 
+from adapters.gptoss_adapter import GptOssAdapter
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from adapters.base_adapter import ModelAdapter
 
 
+@dataclass(slots=True)
+class RoutingLayerRecord:
+    """Router capture for one layer of the last forward pass (host tensors)."""
+    routing_weights: torch.Tensor   # Full [batch, seq, num_experts] softmaxed weights
+    gate_entropy: torch.Tensor      # [batch, seq]
+    expert_usage: torch.Tensor      # [num_experts] top-1 counts
+    shape: torch.Size
+    num_experts: int
+
+
+@dataclass(slots=True)
+class EmbeddingLayerRecord:
+    """MoE MLP output capture for one layer of the last forward pass."""
+    shape: torch.Size
+    norm: torch.Tensor                         # Scalar L2 norm of the full output
+    embedding: Optional[Union[torch.Tensor, np.ndarray]] = None  # [batch, seq, hidden]; memmap if spilled
+
+
+@dataclass(slots=True)
+class ResidualLayerRecord:
+    """Decoder layer output capture for one layer of the last forward pass."""
+    residual_stream: Union[torch.Tensor, np.ndarray]   # [batch, seq, hidden]; memmap if spilled
+    shape: torch.Size
+
+
 class EnhancedRoutingCapture:
     """
     Enhanced MoE routing capture for Concept MRI analysis.
@@ -25,33 +56,42 @@ class EnhancedRoutingCapture:
     """
     
     def __init__(self, model, layers_to_capture: Optional[List[int]] = None,
-                 adapter: Optional['ModelAdapter'] = None):
+                 adapter: Optional['ModelAdapter'] = None, keep_activations: bool = True,
+                 spill_dir: Optional[str] = None):
         self.model = model
-        self.adapter = adapter
+        # False keeps only per-layer norms (summary-only captures, no embedding records)
+        self.keep_activations = keep_activations
+        # If set, activations go to memory-mapped .npy files here instead of host RAM
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self._spilled_paths: List[Path] = []
+        self._pass_index = 0
+        # gpt-oss-20b was the original hardcoded target; use its adapter as the default
+        self.adapter = adapter if adapter is not None else GptOssAdapter()
         self.hooks = []
 
         # Data storage organized for schema conversion
-        self.routing_data = {}        # For RoutingRecord schema
-        self.embedding_data = {}      # For EmbeddingRecord schema
-        self.residual_stream_data = {} # For ResidualStreamState schema
+        self.routing_data: Dict[str, RoutingLayerRecord] = {}            # For RoutingRecord schema
+        self.embedding_data: Dict[str, EmbeddingLayerRecord] = {}        # For EmbeddingRecord schema
+        self.residual_stream_data: Dict[str, ResidualLayerRecord] = {}   # For ResidualStreamState schema
 
-        # Use adapter for defaults, fall back to legacy hardcoded values
         if layers_to_capture is None:
-            layers_to_capture = adapter.layers_range() if adapter else list(range(24))
+            layers_to_capture = self.adapter.layers_range()
 
         self.layers_to_capture = layers_to_capture
+        self._sorted_layers = sorted(layers_to_capture)
+        self._layer_keys = [f"layer_{layer}" for layer in self._sorted_layers]
         logger.info(f"Enhanced capture for layers: {self.layers_to_capture}")
         
     def register_hooks(self, verbose: bool = True):
         """Register all hooks upfront - simple approach."""
+        # Skip building per-layer messages unless debug logging is on
+        verbose = verbose and logger.isEnabledFor(logging.DEBUG)
         for layer_idx in self.layers_to_capture:
             try:
-                if self.adapter:
-                    layer = self.adapter.get_layer(self.model, layer_idx)
-                    moe_block = self.adapter.get_moe_block(layer)
-                else:
-                    layer = self.model.model.layers[layer_idx]
-                    moe_block = layer.mlp
+                layer = self.adapter.get_layer(self.model, layer_idx)
+                moe_block = self.adapter.get_moe_block(layer)
 
                 # 1. MLP hook (captures both routing computation and output)
                 mlp_hook = moe_block.register_forward_hook(
@@ -73,6 +113,8 @@ class EnhancedRoutingCapture:
     
     def _make_mlp_combined_hook(self, layer_id: int):
         """Create combined MLP hook that extracts routing and output data."""
+        layer_key = f"layer_{layer_id}"
+
         def mlp_combined_hook(module, input, output):
             try:
                 # Extract input hidden states
@@ -81,33 +123,24 @@ class EnhancedRoutingCapture:
                 else:
                     hidden_states = input
                 
-                # Compute routing weights via adapter or legacy manual path
-                if self.adapter:
-                    routing_weights = self.adapter.compute_routing_weights(module, hidden_states)
-                else:
-                    batch_size, seq_len, hidden_dim = hidden_states.shape
-                    hidden_states_flat = hidden_states.reshape(-1, hidden_dim)
-                    router_logits = torch.nn.functional.linear(
-                        hidden_states_flat,
-                        module.router.weight,
-                        module.router.bias
-                    )
-                    router_logits = router_logits.reshape(batch_size, seq_len, -1)
-                    routing_weights = torch.softmax(router_logits, dim=-1)
+                routing_weights = self.adapter.compute_routing_weights(module, hidden_states)
                 
-                # Convert to CPU for analysis
-                routing_weights_cpu = routing_weights.detach().cpu()
-
-                # Compute routing statistics
-                gate_entropy = self._compute_entropy(routing_weights_cpu)
+                # Compute routing statistics on device, then copy results to host
+                gate_entropy = self._compute_entropy(routing_weights)
+                num_experts = routing_weights.shape[-1]
+                top1_experts = routing_weights.argmax(dim=-1).flatten()
+                # scatter_add_ instead of bincount: bincount reads min/max back to the host (a sync)
+                expert_usage = torch.zeros(num_experts, dtype=torch.int64, device=routing_weights.device)
+                expert_usage.scatter_add_(0, top1_experts, torch.ones_like(top1_experts))  # [num_experts]
 
                 # Store routing data for schema conversion
-                self.routing_data[f"layer_{layer_id}"] = {
-                    "routing_weights": routing_weights_cpu,      # Full [batch, seq, num_experts] weights
-                    "gate_entropy": gate_entropy,              # [batch, seq]
-                    "shape": routing_weights_cpu.shape,
-                    "num_experts": routing_weights_cpu.shape[-1]
-                }
+                self.routing_data[layer_key] = RoutingLayerRecord(
+                    routing_weights=self._to_host(routing_weights),
+                    gate_entropy=self._to_host(gate_entropy),
+                    expert_usage=self._to_host(expert_usage),
+                    shape=routing_weights.shape,
+                    num_experts=num_experts,
+                )
                 
                 # Also store MLP output (collective expert output)
                 if isinstance(output, tuple):
@@ -115,10 +148,12 @@ class EnhancedRoutingCapture:
                 else:
                     mlp_output = output
                 
-                self.embedding_data[f"layer_{layer_id}"] = {
-                    "embedding": mlp_output.detach().cpu(),
-                    "shape": mlp_output.shape
-                }
+                self.embedding_data[layer_key] = EmbeddingLayerRecord(
+                    shape=mlp_output.shape,
+                    norm=self._to_host(torch.linalg.vector_norm(mlp_output, dtype=torch.float32)),
+                    embedding=self._store_activation(mlp_output, layer_key, "embedding")
+                    if self.keep_activations else None,
+                )
                 
             except Exception as e:
                 logger.error(f"MLP combined hook error (layer {layer_id}): {e}")
@@ -128,6 +163,8 @@ class EnhancedRoutingCapture:
     
     def _make_residual_hook(self, layer_id: int):
         """Create hook for decoder layer to capture full residual stream."""
+        layer_key = f"layer_{layer_id}"
+
         def residual_hook(module, input, output):
             try:
                 # GptOssDecoderLayer.forward() returns plain torch.Tensor
@@ -137,16 +174,88 @@ class EnhancedRoutingCapture:
                 else:
                     residual = output
 
-                self.residual_stream_data[f"layer_{layer_id}"] = {
-                    "residual_stream": residual.detach().cpu(),
-                    "shape": residual.shape
-                }
+                self.residual_stream_data[layer_key] = ResidualLayerRecord(
+                    residual_stream=self._store_activation(residual, layer_key, "residual"),
+                    shape=residual.shape,
+                )
 
             except Exception as e:
                 logger.error(f"Residual hook error (layer {layer_id}): {e}")
 
         return residual_hook
 
+    def _to_host(self, tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Copy a tensor to host memory without blocking the CUDA stream.
+
+        The destination is pinned so the D2H copy overlaps with the next
+        layer's compute. Results are only valid after synchronize().
+        Fresh buffers come from PyTorch's caching host allocator, so captured
+        tensors stay valid after the next forward pass reuses the hooks.
+        """
+        tensor = tensor.detach()
+        if not tensor.is_cuda:
+            return tensor.cpu()
+        host = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+        host.copy_(tensor, non_blocking=True)
+        return host
+
+    def _store_activation(self, tensor: torch.Tensor, layer_key: str,
+                          kind: str) -> torch.Tensor:
+        """
+        Keep a full activation tensor for schema conversion.
+
+        Always an async host copy so the hook never blocks the CUDA stream.
+        With spill_dir the copy is moved to disk by _spill_activations() once
+        synchronize() has made it valid.
+        """
+        return self._to_host(tensor)
+
+    def _spill_path(self, layer_key: str, kind: str) -> Path:
+        """Spill file name, unique per process, capture instance and forward pass."""
+        return self.spill_dir / (
+            f"cap_{os.getpid()}_{id(self):x}_{self._pass_index}_{layer_key}_{kind}.npy"
+        )
+
+    def _spill_tensor(self, tensor: torch.Tensor, layer_key: str, kind: str) -> np.ndarray:
+        """Write a host tensor to a .npy file and return it as a read-only memory map."""
+        if tensor.dtype == torch.bfloat16:
+            tensor = tensor.float()  # numpy has no bfloat16
+        path = self._spill_path(layer_key, kind)
+        np.save(path, tensor.numpy())
+        self._spilled_paths.append(path)
+        return np.load(path, mmap_mode="r")
+
+    def _spill_activations(self):
+        """
+        Move captured activations from host memory to spill_dir memory maps.
+
+        Host RSS then stays bounded by the pages actually read downstream.
+        Records already spilled hold np.ndarray and are skipped.
+        """
+        if self.spill_dir is None:
+            return
+        for layer_key, record in self.embedding_data.items():
+            if isinstance(record.embedding, torch.Tensor):
+                record.embedding = self._spill_tensor(record.embedding, layer_key, "embedding")
+        for layer_key, record in self.residual_stream_data.items():
+            if isinstance(record.residual_stream, torch.Tensor):
+                record.residual_stream = self._spill_tensor(
+                    record.residual_stream, layer_key, "residual"
+                )
+
+    def synchronize(self):
+        """Wait for pending host copies - call once per forward pass before reading data.
+
+        Copies are issued on whichever device owns each layer (device_map="auto"
+        can spread layers across GPUs), so every device is synchronized.
+        With spill_dir, activations are written to disk once the copies land.
+        """
+        if torch.cuda.is_available():
+            for device in range(torch.cuda.device_count()):
+                torch.cuda.synchronize(device)
+        self._spill_activations()
+
     def _compute_entropy(self, routing_weights: torch.Tensor) -> torch.Tensor:
         """Compute entropy of routing distribution. Input must be already softmaxed."""
         eps = 1e-8
@@ -159,6 +268,12 @@ class EnhancedRoutingCapture:
         self.routing_data.clear()
         self.embedding_data.clear()
         self.residual_stream_data.clear()
+
+        # Unlinking is safe while old memory maps are still referenced (POSIX)
+        for path in self._spilled_paths:
+            path.unlink(missing_ok=True)
+        self._spilled_paths.clear()
+        self._pass_index += 1
     
     def remove_hooks(self):
         """Remove all registered hooks."""
@@ -170,49 +285,60 @@ class EnhancedRoutingCapture:
         """Extract expert highway signatures using top-1 from full routing weights."""
         if not self.routing_data:
             return []
+        self.synchronize()
 
-        highways = []
         seq_len = len(tokens)
+        present = [(layer, key) for layer, key in zip(self._sorted_layers, self._layer_keys)
+                   if key in self.routing_data]
+        if not present:
+            return [""] * seq_len
+        layers = [layer for layer, _ in present]
 
-        for pos in range(seq_len):
-            highway_parts = []
-            for layer in sorted(self.layers_to_capture):
-                layer_key = f"layer_{layer}"
-                if layer_key in self.routing_data:
-                    weights = self.routing_data[layer_key]["routing_weights"]
-                    top1_expert_id = weights[batch_idx, pos, :].argmax().item()
-                    highway_parts.append(f"L{layer}E{top1_expert_id}")
+        captured_len = self.routing_data[present[0][1]].routing_weights.shape[1]
+        if seq_len > captured_len:
+            raise IndexError(f"Got {seq_len} tokens but only {captured_len} positions were captured")
 
-            highway_signature = "→".join(highway_parts)
-            highways.append(highway_signature)
+        # One argmax per layer over all positions -> [seq_len, num_layers]
+        top1 = np.stack([
+            self.routing_data[key].routing_weights[batch_idx, :seq_len].argmax(dim=-1).numpy()
+            for _, key in present
+        ], axis=1)
 
-        return highways
+        return ["→".join(f"L{layer}E{expert}" for layer, expert in zip(layers, row))
+                for row in top1.tolist()]
     
     def get_summary(self) -> Dict:
         """Get comprehensive summary of captured data."""
+        self.synchronize()
         summary = {
             "routing_summary": {},
             "activation_summary": {}
         }
         
         # Routing summary
-        for layer_name, data in self.routing_data.items():
-            # Expert usage statistics from argmax of full routing weights
-            top1_experts = data["routing_weights"].argmax(dim=-1).flatten()
-            expert_counts = torch.bincount(top1_experts, minlength=data["num_experts"])
+        for layer_name in self._layer_keys:
+            data = self.routing_data.get(layer_name)
+            if data is None:
+                continue
+            # Expert usage counts were reduced on device by the hook;
+            # active experts fall out of them in O(num_experts), no sort needed
+            expert_counts = data.expert_usage
 
             summary["routing_summary"][layer_name] = {
-                "shape": data["shape"],
-                "num_active_experts": len(torch.unique(top1_experts)),
-                "mean_entropy": data["gate_entropy"].mean().item(),
+                "shape": data.shape,
+                "num_active_experts": int((expert_counts > 0).sum()),
+                "mean_entropy": data.gate_entropy.mean().item(),
                 "expert_usage": expert_counts.tolist()
             }
         
         # Embedding summary
-        for layer_name, data in self.embedding_data.items():
+        for layer_name in self._layer_keys:
+            data = self.embedding_data.get(layer_name)
+            if data is None:
+                continue
             summary["activation_summary"][layer_name] = {
-                "shape": data["shape"],
-                "activation_norm": torch.norm(data["embedding"]).item()
+                "shape": data.shape,
+                "activation_norm": float(data.norm)
             }
         
         return summary
\ No newline at end of file
@@ -4,29 +4,48 @@ Ultra-simple GPU memory utilities for demo stability.
 Just cleanup and reporting - no fancy context managers.
 """
 
+import functools
 import torch
 from typing import Dict, Union
 
 
+@functools.lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """CUDA availability cannot change during the process lifetime."""
+    return torch.cuda.is_available()
+
+
+@functools.lru_cache(maxsize=None)
+def _total_memory_gb() -> float:
+    """Total memory of device 0 in GB (immutable, so queried from the driver once)."""
+    return torch.cuda.get_device_properties(0).total_memory / 1024**3
+
+
+@functools.lru_cache(maxsize=None)
+def get_gpu_name() -> Union[str, None]:
+    """Name of device 0, or None without CUDA (queried from the driver once)."""
+    return torch.cuda.get_device_name(0) if _cuda_available() else None
+
+
 def cleanup_gpu_memory():
     """Clean up GPU memory - call after capture operations."""
-    if torch.cuda.is_available():
+    if _cuda_available():
         torch.cuda.empty_cache()
         torch.cuda.synchronize()
 
 
 def get_gpu_memory_info() -> Dict[str, Union[float, str]]:
     """Get current GPU memory usage for debugging."""
-    if not torch.cuda.is_available():
+    if not _cuda_available():
         return {"error": "CUDA not available"}
     
     allocated = torch.cuda.memory_allocated() / 1024**3  # GB
     reserved = torch.cuda.memory_reserved() / 1024**3    # GB
-    max_memory = torch.cuda.get_device_properties(0).total_memory / 1024**3  # GB
+    max_memory = _total_memory_gb()
     
     return {
         "allocated_gb": round(allocated, 2),
         "reserved_gb": round(reserved, 2), 
         "max_memory_gb": round(max_memory, 2),
         "utilization_percent": round((allocated / max_memory) * 100, 1)
-    }
\ No newline at end of file
+    }
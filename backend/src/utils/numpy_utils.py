@@ -4,6 +4,7 @@ Numpy utilities for consistent array handling across all schemas.
 Prevents DRY violations in data processing and validation.
 """
 
+import math
 from typing import Union, Tuple, List, Any
 import numpy as np
 
@@ -17,14 +18,14 @@ def ensure_numpy_array(data: Union[np.ndarray, List, Any], dtype: np.dtype = np.
         dtype: Target numpy dtype (default: float32)
     
     Returns:
-        Numpy array with specified dtype
+        Numpy array with specified dtype. An ndarray that already has that
+        dtype is returned as-is (no copy), so callers must not mutate the
+        result unless they own the input.
     """
-    if not isinstance(data, np.ndarray):
-        data = np.array(data, dtype=dtype)
-    elif data.dtype != dtype:
-        data = data.astype(dtype)
+    if type(data) is np.ndarray:
+        return data if data.dtype == dtype else data.astype(dtype, copy=False)
     
-    return data
+    return np.asarray(data, dtype=dtype)
 
 
 def validate_finite_array(data: np.ndarray, context: str = "Array") -> None:
@@ -57,16 +58,36 @@ def calculate_array_stats(data: np.ndarray) -> dict:
     Returns:
         Dictionary with mean, std, min, max, median statistics
     """
-    flat_data = data.flatten()
+    flat_data = data.ravel()  # view, no copy for contiguous input
+    mean = flat_data.mean()
+    centered = flat_data - mean
     return {
-        "mean": float(np.mean(flat_data)),
-        "std": float(np.std(flat_data)),
-        "min": float(np.min(flat_data)),
-        "max": float(np.max(flat_data)),
-        "median": float(np.median(flat_data))
+        "mean": float(mean),
+        "std": float(np.sqrt(np.dot(centered, centered) / flat_data.size)),
+        "min": float(flat_data.min()),
+        "max": float(flat_data.max()),
+        "median": _median_by_selection(flat_data)
     }
 
 
+def _median_by_selection(flat_data: np.ndarray) -> float:
+    """Median via O(N) partial selection instead of a full sort."""
+    n = flat_data.size
+    mid = n // 2
+    if n % 2:
+        return float(np.partition(flat_data, mid)[mid])
+    lower, upper = np.partition(flat_data, (mid - 1, mid))[mid - 1:mid + 1]
+    # Promote before adding so narrow dtypes (int8, float16) cannot overflow
+    return (float(lower) + float(upper)) / 2
+
+
+def _as_float(data: np.ndarray) -> np.ndarray:
+    """Floating arrays pass through; integer/bool arrays become float64 so dot products cannot overflow."""
+    if np.issubdtype(data.dtype, np.inexact):
+        return data
+    return data.astype(np.float64)
+
+
 def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """
     Calculate cosine similarity between two vectors.
@@ -81,22 +102,50 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     Raises:
         ValueError: If vectors have different total sizes
     """
-    # Flatten both vectors
-    flat1 = vec1.flatten()
-    flat2 = vec2.flatten()
+    if vec1.size != vec2.size:
+        raise ValueError(f"Vector size mismatch: {vec1.size} vs {vec2.size}")
     
-    if len(flat1) != len(flat2):
-        raise ValueError(f"Vector size mismatch: {len(flat1)} vs {len(flat2)}")
+    # Flatten both vectors (views, no copy for contiguous input)
+    flat1 = _as_float(vec1.ravel())
+    flat2 = _as_float(vec2.ravel())
     
-    # Compute cosine similarity
-    dot_product = np.dot(flat1, flat2)
-    norm1 = np.linalg.norm(flat1)
-    norm2 = np.linalg.norm(flat2)
+    # All three reductions run before any divide, while the buffers are cache-hot
+    dot_product = float(flat1 @ flat2)
+    sq_norm1 = float(flat1 @ flat1)
+    sq_norm2 = float(flat2 @ flat2)
     
-    if norm1 == 0 or norm2 == 0:
+    if sq_norm1 == 0 or sq_norm2 == 0:
         return 0.0
     
-    return float(dot_product / (norm1 * norm2))
+    return dot_product / math.sqrt(sq_norm1 * sq_norm2)
+
+
+def cosine_similarity_batch(vecs1: np.ndarray, vecs2: np.ndarray) -> np.ndarray:
+    """
+    Calculate row-wise cosine similarity between two stacks of vectors.
+    
+    Args:
+        vecs1: First stack, shape [n, d]
+        vecs2: Second stack, shape [n, d]
+        
+    Returns:
+        Array of n similarity scores (0.0 where either row has zero norm)
+        
+    Raises:
+        ValueError: If the stacks have different shapes
+    """
+    if vecs1.shape != vecs2.shape:
+        raise ValueError(f"Shape mismatch: {vecs1.shape} vs {vecs2.shape}")
+    
+    vecs1 = _as_float(vecs1)
+    vecs2 = _as_float(vecs2)
+    dots = np.einsum('ni,ni->n', vecs1, vecs2)
+    sq_norms = np.einsum('ni,ni->n', vecs1, vecs1) * np.einsum('ni,ni->n', vecs2, vecs2)
+    
+    result = np.zeros(len(dots), dtype=np.float64)
+    nonzero = sq_norms > 0
+    result[nonzero] = dots[nonzero] / np.sqrt(sq_norms[nonzero])
+    return result
 
 
 def normalize_for_clustering(data: np.ndarray, method: str = "standard") -> np.ndarray:
@@ -113,18 +162,24 @@ def normalize_for_clustering(data: np.ndarray, method: str = "standard") -> np.n
     Raises:
         ValueError: If normalization method is unknown
     """
-    flat_data = data.flatten()
+    flat_data = data.ravel()
     
     if method == "standard":
-        # Z-score normalization (zero mean, unit variance)
-        return (flat_data - np.mean(flat_data)) / (np.std(flat_data) + 1e-8)
+        # Z-score normalization (zero mean, unit variance), reusing the centered buffer
+        centered = flat_data - flat_data.mean()
+        std = np.sqrt(np.dot(centered, centered) / centered.size)
+        centered /= (std + 1e-8)
+        return centered
     elif method == "minmax":
         # Min-max scaling to [0, 1] range
-        min_val, max_val = np.min(flat_data), np.max(flat_data)
-        return (flat_data - min_val) / (max_val - min_val + 1e-8)
+        min_val, max_val = flat_data.min(), flat_data.max()
+        # Float temporary so the in-place divide also works for integer input
+        scaled = np.subtract(flat_data, min_val, dtype=np.result_type(flat_data, np.float32))
+        scaled /= (max_val - min_val + 1e-8)
+        return scaled
     elif method == "none":
-        # No normalization
-        return flat_data
+        # No normalization (copy so callers never alias the source array)
+        return flat_data.copy()
     else:
         raise ValueError(f"Unknown normalization method: {method}")
 
@@ -4,15 +4,25 @@ Parquet serialization utilities for numpy arrays.
 Handles consistent serialization/deserialization across all schemas.
 """
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple, Union
 import numpy as np
+import pyarrow as pa
 
 
-def serialize_array_for_parquet(data: np.ndarray) -> List[float]:
-    """Serialize numpy array for Parquet storage as list<float>."""
-    return data.flatten().tolist()
+def serialize_array_for_parquet(data: np.ndarray) -> np.ndarray:
+    """Flatten numpy array to a contiguous float32 buffer for Parquet list<float> storage."""
+    return np.ascontiguousarray(data, dtype=np.float32).reshape(-1)
 
 
-def deserialize_array_from_parquet(data: List[float], dims: Tuple[int, ...]) -> np.ndarray:
+def pack_arrays_as_list_column(arrays: Sequence[np.ndarray]) -> pa.ListArray:
+    """Build an Arrow list<float> column from flat arrays without boxing each float."""
+    lengths = np.fromiter((len(a) for a in arrays), dtype=np.int32, count=len(arrays))
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int32)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.concatenate(arrays) if len(arrays) else np.empty(0, dtype=np.float32)
+    return pa.ListArray.from_arrays(pa.array(offsets), pa.array(values))
+
+
+def deserialize_array_from_parquet(data: Union[List[float], np.ndarray], dims: Tuple[int, ...]) -> np.ndarray:
     """Deserialize array from Parquet list<float> storage."""
-    return np.array(data, dtype=np.float32).reshape(dims)
\ No newline at end of file
+    return np.asarray(data, dtype=np.float32).reshape(dims)
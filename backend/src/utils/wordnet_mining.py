@@ -4,20 +4,50 @@ Simple WordNet mining for unambiguous semantic categories.
 Provides synset-based word mining with single-sense filtering for clean demos.
 """
 
+from functools import lru_cache
+from itertools import islice
+import threading
 import nltk
 from nltk.corpus import wordnet
-from typing import List, Tuple, Dict
+from typing import Iterator, List, Tuple, Dict
+
+# Max words per batched tokenizer call (bounds memory for large candidate lists)
+TOKENIZE_BATCH_SIZE = 1024
+
+# Synsets scanned per POS when mining POS-pure words
+POS_SYNSET_LIMIT = 1000
+
+# First POS_SYNSET_LIMIT synsets per POS, materialized once per process
+_POS_SYNSETS_CACHE: Dict[str, list] = {}
+
+# WordNet corpus availability is checked once per process
+_WORDNET_READY = False
+
+
+@lru_cache(maxsize=None)
+def _sense_info(word: str) -> Tuple[int, frozenset]:
+    """Sense count and POS tag set for a word from one memoized synsets() lookup (morphy is expensive)."""
+    synsets = wordnet.synsets(word)
+    return len(synsets), frozenset(s.pos() for s in synsets)
 
 
 class WordNetMiner:
     """Simple WordNet mining with unambiguous word filtering."""
     
+    # Fallback byte bound for one token when the tokenizer exposes no vocabulary
+    MAX_SINGLE_TOKEN_BYTES = 16
+    
     def __init__(self, tokenizer):
         self.tokenizer = tokenizer
+        self.max_single_token_bytes = self._max_token_bytes()
         self._ensure_wordnet_data()
+        self._build_vocab_tables()
     
     def _ensure_wordnet_data(self):
-        """Download WordNet data if needed."""
+        """Download WordNet data if needed (once per process)."""
+        global _WORDNET_READY
+        if _WORDNET_READY:
+            return
         try:
             wordnet.synsets('test')
         except (LookupError, AttributeError) as e:
@@ -32,43 +62,89 @@ class WordNetMiner:
                 importlib.reload(nltk.corpus.wordnet)
                 from nltk.corpus import wordnet as reloaded_wordnet
                 globals()['wordnet'] = reloaded_wordnet
+        _WORDNET_READY = True
+    
+    def _build_vocab_tables(self):
+        """Precompute single-token, unambiguous and POS-pure vocabularies once per miner.
+        
+        These depend only on WordNet and the tokenizer, so mining calls reduce to set lookups.
+        """
+        names = [n for n in wordnet.all_lemma_names() if '_' not in n]  # NLTK joins multi-word lemmas with '_'
+        self.single_token_words = set(self._single_token_words(names))
+        
+        self.unambiguous_words = set()
+        self.pos_pure_words: Dict[str, set] = {p: set() for p in 'nvars'}
+        for word in self.single_token_words:
+            sense_count, pos_set = _sense_info(word)
+            if sense_count == 1:
+                self.unambiguous_words.add(word)
+            if len(pos_set) == 1:
+                self.pos_pure_words.setdefault(next(iter(pos_set)), set()).add(word)
     
-    def mine_unambiguous_words(self, synset_id: str, max_depth: int = 2) -> List[str]:
-        """Mine globally unambiguous single-token words from synset hierarchy."""
+    def _max_token_bytes(self) -> int:
+        """UTF-8 byte length of the longest vocabulary entry (safe for BPE, SentencePiece and WordPiece)."""
         try:
-            synset = wordnet.synset(synset_id)
-        except Exception as e:
-            raise ValueError(f"Invalid synset ID '{synset_id}': {e}")
-        
-        # Get hyponyms up to max_depth levels (substitution principle)
+            return max(len(token.encode('utf-8')) for token in self.tokenizer.get_vocab())
+        except (AttributeError, TypeError, ValueError):
+            return self.MAX_SINGLE_TOKEN_BYTES
+    
+    def _single_token_words(self, candidates: List[str]) -> List[str]:
+        """Keep candidates that encode to exactly one token, using batched tokenizer calls."""
+        # Words longer than any vocabulary entry cannot be a single token
+        candidates = [w for w in candidates if len(w.encode('utf-8')) <= self.max_single_token_bytes]
+        single = []
+        for start in range(0, len(candidates), TOKENIZE_BATCH_SIZE):
+            batch = candidates[start:start + TOKENIZE_BATCH_SIZE]
+            token_ids = self.tokenizer(batch, add_special_tokens=False)['input_ids']
+            single.extend(word for word, ids in zip(batch, token_ids) if len(ids) == 1)
+        return single
+    
+    def _expand(self, synset) -> list:
+        """Child synsets for traversal; adjectives and adverbs have no hyponym edges."""
+        pos = synset.pos()
+        if pos == 'n' or pos == 'v':  # Verb troponyms are stored as hyponyms in NLTK
+            return synset.hyponyms()
+        if pos == 'a' or pos == 's':  # Adjective satellite cluster
+            return synset.similar_tos()
+        if pos == 'r':  # Adverb -> derived-from adjective -> its cluster
+            adjs = [p.synset() for lemma in synset.lemmas() for p in lemma.pertainyms()]
+            return [x for a in adjs for x in a.similar_tos()]
+        return []
+    
+    def _collect_hyponyms(self, synset, max_depth: int) -> list:
+        """Breadth-first expansion, visiting each synset once (WordNet is a DAG)."""
+        visited = {synset}
         all_hyponyms = [synset]  # Include root synset
-        current_level = [synset]
+        frontier = [synset]
         
         for depth in range(max_depth):
             next_level = []
-            for current_synset in current_level:
-                next_level.extend(current_synset.hyponyms())
-            if not next_level:  # No more hyponyms
+            for current_synset in frontier:
+                for hyponym in self._expand(current_synset):
+                    if hyponym not in visited:
+                        visited.add(hyponym)
+                        next_level.append(hyponym)
+            if not next_level:  # No more unvisited hyponyms
                 break
             all_hyponyms.extend(next_level)
-            current_level = next_level
-        
-        # Extract and filter words
-        filtered_words = []
-        for hyponym in all_hyponyms:
-            for lemma in hyponym.lemmas():
-                word = lemma.name().lower()
-                
-                # Skip multi-word terms
-                if '_' not in word and ' ' not in word:
-                    # Filter 1: Globally unambiguous (single word sense)
-                    if len(wordnet.synsets(word)) == 1:
-                        # Filter 2: Single token only
-                        tokens = self.tokenizer.encode(word, add_special_tokens=False)
-                        if len(tokens) == 1:
-                            filtered_words.append(word)
-        
-        result = sorted(set(filtered_words))  # Remove duplicates and sort
+            frontier = next_level
+        
+        return all_hyponyms
+    
+    def mine_unambiguous_words(self, synset_id: str, max_depth: int = 2, sort: bool = True) -> List[str]:
+        """Mine globally unambiguous single-token words from synset hierarchy (sorted unless sort=False)."""
+        try:
+            synset = wordnet.synset(synset_id)
+        except Exception as e:
+            raise ValueError(f"Invalid synset ID '{synset_id}': {e}")
+        
+        # Get hyponyms up to max_depth levels (substitution principle)
+        all_hyponyms = self._collect_hyponyms(synset, max_depth)
+        
+        # Keep globally unambiguous single-token words (multi-word terms are not in the table)
+        words = {lemma.name().lower() for hyponym in all_hyponyms for lemma in hyponym.lemmas()}
+        result = words & self.unambiguous_words
+        result = sorted(result) if sort else list(result)
         
         if not result:
             print(f"⚠️ Warning: No unambiguous words found for synset '{synset_id}'")
@@ -79,47 +155,32 @@ class WordNetMiner:
         """Return full synset ID for transparency."""
         return synset_id
     
-    def mine_pos_pure_words(self, pos: str, max_words: int = 30) -> List[str]:
-        """Mine words that are ONLY this POS (noun, verb, adj, etc.)."""
+    def mine_pos_pure_words(self, pos: str, max_words: int = 30, sort: bool = True) -> List[str]:
+        """Mine words that are ONLY this POS (noun, verb, adj, etc.), sorted unless sort=False."""
         print(f"🔍 Mining words that are ONLY {pos}...")
         
-        words_found = []
-        checked_words = set()
-        
-        # Go through WordNet synsets for this POS
-        for synset in list(wordnet.all_synsets(pos=pos))[:1000]:  # Limit for speed
-            for lemma in synset.lemmas():
-                word = lemma.name().lower()
-                
-                # Skip if already checked or has underscores/spaces
-                if word in checked_words or '_' in word or ' ' in word:
-                    continue
-                
-                checked_words.add(word)
-                
-                # Check: does this word ONLY appear as this POS?
-                all_synsets = wordnet.synsets(word)
-                all_pos = set(s.pos() for s in all_synsets)
-                
-                if len(all_pos) == 1 and pos in all_pos:  # Only this POS
-                    # Check single token
-                    try:
-                        tokens = self.tokenizer.encode(word, add_special_tokens=False)
-                        if len(tokens) == 1:
-                            words_found.append(word)
-                            
-                            if len(words_found) >= max_words:
-                                break
-                    except Exception:
-                        continue
-            
-            if len(words_found) >= max_words:
-                break
-        
-        result = sorted(set(words_found))
+        # Candidates are already single-token, so take the first max_words
+        result = list(islice(self._pos_pure_candidates(pos), max_words))  # Already unique
+        if sort:
+            result.sort()
         print(f"✅ Found {len(result)} pure {pos} words")
         return result
     
+    def _pos_pure_candidates(self, pos: str) -> Iterator[str]:
+        """Yield unique single-token words whose every WordNet sense has this POS."""
+        pure_words = self.pos_pure_words.get(pos, set())
+        checked_words = set()
+        
+        # Go through WordNet synsets for this POS (limited for speed, cached per POS)
+        if pos not in _POS_SYNSETS_CACHE:
+            _POS_SYNSETS_CACHE[pos] = list(islice(wordnet.all_synsets(pos=pos), POS_SYNSET_LIMIT))
+        for synset in _POS_SYNSETS_CACHE[pos]:
+            for word in [lemma.name().lower() for lemma in synset.lemmas()]:
+                # Check: does this word ONLY appear as this POS? (multi-word lemmas never do)
+                if word in pure_words and word not in checked_words:
+                    checked_words.add(word)
+                    yield word
+    
     def mine_pos_categories(self, pos_categories: List[str], max_words_per_pos: int = 30) -> Dict[str, List[str]]:
         """Mine POS-pure words for multiple POS categories."""
         results = {}
@@ -134,43 +195,20 @@ class WordNetMiner:
         
         return results
     
-    def mine_all_words(self, synset_id: str, max_depth: int = 2) -> List[str]:
-        """Mine all single-token words from synset hierarchy, including ambiguous words."""
+    def mine_all_words(self, synset_id: str, max_depth: int = 2, sort: bool = True) -> List[str]:
+        """Mine all single-token words from synset hierarchy, including ambiguous words (sorted unless sort=False)."""
         try:
             synset = wordnet.synset(synset_id)
         except Exception as e:
             raise ValueError(f"Invalid synset ID '{synset_id}': {e}")
         
         # Get hyponyms up to max_depth levels
-        all_hyponyms = [synset]  # Include root synset
-        current_level = [synset]
+        all_hyponyms = self._collect_hyponyms(synset, max_depth)
         
-        for depth in range(max_depth):
-            next_level = []
-            for current_synset in current_level:
-                next_level.extend(current_synset.hyponyms())
-            if not next_level:  # No more hyponyms
-                break
-            all_hyponyms.extend(next_level)
-            current_level = next_level
-        
-        # Extract words (allowing ambiguous words)
-        all_words = []
-        for hyponym in all_hyponyms:
-            for lemma in hyponym.lemmas():
-                word = lemma.name().lower()
-                
-                # Skip multi-word terms
-                if '_' not in word and ' ' not in word:
-                    # Only filter for single token (allow ambiguous words)
-                    try:
-                        tokens = self.tokenizer.encode(word, add_special_tokens=False)
-                        if len(tokens) == 1:
-                            all_words.append(word)
-                    except Exception:
-                        continue
-        
-        result = sorted(set(all_words))  # Remove duplicates and sort
+        # Extract words (allowing ambiguous words), keeping only single-token ones
+        words = {lemma.name().lower() for hyponym in all_hyponyms for lemma in hyponym.lemmas()}
+        result = words & self.single_token_words
+        result = sorted(result) if sort else list(result)
         
         if not result:
             print(f"⚠️ Warning: No single-token words found for synset '{synset_id}'")
@@ -180,10 +218,24 @@ class WordNetMiner:
         return result
 
 
+# Shared miners keyed by tokenizer identity (each miner holds its tokenizer, so ids stay unique)
+_MINER_CACHE: Dict[int, WordNetMiner] = {}
+_MINER_LOCK = threading.Lock()
+
+
+def _get_miner(tokenizer) -> WordNetMiner:
+    """Return the process-wide miner for this tokenizer, creating it on first use."""
+    with _MINER_LOCK:
+        miner = _MINER_CACHE.get(id(tokenizer))
+        if miner is None:
+            miner = _MINER_CACHE[id(tokenizer)] = WordNetMiner(tokenizer)
+        return miner
+
+
 # Convenience function for API usage
 def mine_category_words(synset_id: str, tokenizer) -> Tuple[List[str], str]:
     """Mine unambiguous words and return with synset label."""
-    miner = WordNetMiner(tokenizer)
+    miner = _get_miner(tokenizer)
     words = miner.mine_unambiguous_words(synset_id)
     label = miner.get_synset_label(synset_id)
     return words, label
\ No newline at end of file
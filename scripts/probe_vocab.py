@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Shared single-token word vocabularies for probe-building scripts.
+Categories are frozensets; derived target lists are built once at import.
+"""
+
+import json
+from pathlib import Path
+
+# Single-token word collections live in data/probe_words.json (one list per category).
+# Frozensets: overlaps within and across categories collapse at load, unions are hashed
+_WORDS_FILE = Path(__file__).resolve().parent.parent / "data" / "probe_words.json"
+
+with open(_WORDS_FILE) as f:
+    _WORDS = {name: frozenset(words) for name, words in json.load(f).items()}
+
+SIMPLE_CONCRETE_POSITIVE_NOUNS = _WORDS["simple_concrete_positive_nouns"]
+SIMPLE_CONCRETE_NEGATIVE_NOUNS = _WORDS["simple_concrete_negative_nouns"]
+SIMPLE_CONCRETE_NEUTRAL_NOUNS = _WORDS["simple_concrete_neutral_nouns"]
+SIMPLE_ABSTRACT_POSITIVE_NOUNS = _WORDS["simple_abstract_positive_nouns"]
+SIMPLE_ACTION_POSITIVE_VERBS = _WORDS["simple_action_positive_verbs"]
+TEMPORAL_WORDS = _WORDS["temporal_words"]
+COGNITIVE_WORDS = _WORDS["cognitive_words"]
+
+# Derived categories, built once at import as sorted lists ready for the API payload
+_ALL_NOUNS = (SIMPLE_CONCRETE_POSITIVE_NOUNS | SIMPLE_CONCRETE_NEGATIVE_NOUNS |
+              SIMPLE_CONCRETE_NEUTRAL_NOUNS | SIMPLE_ABSTRACT_POSITIVE_NOUNS)
+# Would include all other noun categories when fully expanded
+_ALL_VERBS = SIMPLE_ACTION_POSITIVE_VERBS
+# Would include all other verb categories when fully expanded
+
+ALL_NOUNS = sorted(_ALL_NOUNS)
+ALL_VERBS = sorted(_ALL_VERBS)
+CONTENT_WORDS = sorted(_ALL_NOUNS | _ALL_VERBS)
+CONCRETE_NOUNS = sorted(SIMPLE_CONCRETE_POSITIVE_NOUNS | SIMPLE_CONCRETE_NEGATIVE_NOUNS | SIMPLE_CONCRETE_NEUTRAL_NOUNS)
+ABSTRACT_NOUNS = sorted(SIMPLE_ABSTRACT_POSITIVE_NOUNS)
+# Would include all abstract categories when fully expanded
+POSITIVE_WORDS = sorted(SIMPLE_CONCRETE_POSITIVE_NOUNS | SIMPLE_ABSTRACT_POSITIVE_NOUNS | SIMPLE_ACTION_POSITIVE_VERBS)
+NEGATIVE_WORDS = sorted(SIMPLE_CONCRETE_NEGATIVE_NOUNS)
+NEUTRAL_WORDS = sorted(SIMPLE_CONCRETE_NEUTRAL_NOUNS)
+TEMPORAL_LIST = sorted(TEMPORAL_WORDS)
+COGNITIVE_LIST = sorted(COGNITIVE_WORDS)
+
+# Target categories for the massive probe, label -> sorted word list (shared objects, no copies)
+TARGET_CATEGORIES = {
+    # Content/Function categories
+    "content": CONTENT_WORDS,
+    # POS categories
+    "nouns": ALL_NOUNS,
+    "verbs": ALL_VERBS,
+    # Concreteness for nouns
+    "concrete": CONCRETE_NOUNS,
+    "abstract": ABSTRACT_NOUNS,
+    # Sentiment categories
+    "positive": POSITIVE_WORDS,
+    "negative": NEGATIVE_WORDS,
+    "neutral": NEUTRAL_WORDS,
+    # Temporal and cognitive categories
+    "temporal": TEMPORAL_LIST,
+    "cognitive": COGNITIVE_LIST,
+}
+
+# Union of every target category, for unique-target statistics
+ALL_TARGET_WORDS = frozenset().union(*TARGET_CATEGORIES.values())